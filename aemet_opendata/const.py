@@ -113,7 +113,13 @@ AOD_WIND_DIRECTION: Final[str] = "wind-direction"
 AOD_WIND_SPEED: Final[str] = "wind-speed"
 AOD_WIND_SPEED_MAX: Final[str] = "wind-speed-max"
 
+API_CMD_CLIMATOLOGICAL_STATIONS: Final[str] = (
+    "valores/climatologicos/inventarioestaciones/todasestaciones"
+)
+API_CMD_CONVENTIONAL_STATIONS: Final[str] = "observacion/convencional/todas"
+API_CMD_TOWNS: Final[str] = "maestro/municipios"
 API_ID_PFX: Final[str] = "id"
+API_MAX_REQUESTS: Final[int] = 8
 API_MIN_STATION_DISTANCE_KM: Final[int] = 40
 API_MIN_TOWN_DISTANCE_KM: Final[int] = 40
 API_PERIOD_24H: Final[int] = 24
@@ -125,16 +131,31 @@ API_PERIOD_QUARTER_2_DAY: Final[str] = "06-12"
 API_PERIOD_QUARTER_3_DAY: Final[str] = "12-18"
 API_PERIOD_QUARTER_4_DAY: Final[str] = "18-24"
 API_PERIOD_SPLIT: Final[int] = 2
+API_RETRIES: Final[int] = 3
+API_RETRY_BACKOFF: Final[float] = 0.3
+API_RETRY_STATUS: Final[tuple[int, ...]] = (500, 502, 503, 504)
 API_TIMEOUT: Final[int] = 15
 API_URL: Final[str] = "https://opendata.aemet.es/opendata/api"
 
 ATTR_DATA: Final[str] = "data"
 ATTR_DISTANCE: Final[str] = "distance"
+ATTR_LATITUDE: Final[str] = "latitude"
+ATTR_LONGITUDE: Final[str] = "longitude"
 ATTR_RESPONSE: Final[str] = "response"
 
+EARTH_RADIUS_KM: Final[float] = 6371.009
+
 RAW_FORECAST_DAILY: Final[str] = "forecast-daily"
 RAW_FORECAST_HOURLY: Final[str] = "forecast-hourly"
 RAW_STATIONS: Final[str] = "stations"
 RAW_TOWNS: Final[str] = "towns"
 
 STATION_MAX_DELTA: Final[timedelta] = timedelta(hours=2)
+
+STORAGE_CLIMATOLOGICAL_STATIONS: Final[str] = "climatological-stations"
+STORAGE_CONVENTIONAL_STATIONS: Final[str] = "conventional-stations"
+STORAGE_DATA: Final[str] = "data"
+STORAGE_MAX_AGE: Final[timedelta] = timedelta(days=7)
+STORAGE_TIMESTAMP: Final[str] = "timestamp"
+STORAGE_TOWNS: Final[str] = "towns"
+STORAGE_VALIDATORS: Final[str] = "validators"
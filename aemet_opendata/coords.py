@@ -0,0 +1,160 @@
+"""AEMET OpenData Coordinates."""
+
+from collections.abc import Callable
+import math
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .const import EARTH_RADIUS_KM
+
+try:
+    from scipy.spatial import KDTree
+except ImportError:
+    KDTree = None
+
+
+def coords_to_xyz(
+    latitudes: NDArray[np.float64], longitudes: NDArray[np.float64]
+) -> NDArray[np.float64]:
+    """Convert coordinates to unit sphere cartesian points."""
+    lats = np.radians(latitudes)
+    lons = np.radians(longitudes)
+    cos_lats = np.cos(lats)
+    return np.column_stack(
+        (cos_lats * np.cos(lons), cos_lats * np.sin(lons), np.sin(lats))
+    )
+
+
+def haversine_km(start: tuple[float, float], end: tuple[float, float]) -> float:
+    """Return great circle distance (km) between 2 points."""
+    lat1 = math.radians(start[0])
+    lat2 = math.radians(end[0])
+    dlat = lat2 - lat1
+    dlon = math.radians(end[1] - start[1])
+    a = (
+        math.sin(dlat / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+
+def bounding_box_mask(
+    coords: tuple[float, float],
+    latitudes: NDArray[np.float64],
+    longitudes: NDArray[np.float64],
+    max_distance: float,
+) -> NDArray[np.bool_]:
+    """Return mask of coordinates which may be closer than max distance (km)."""
+    lat0 = math.radians(coords[0])
+    angle = max_distance / EARTH_RADIUS_KM
+    dlat = math.degrees(angle)
+
+    mask = np.abs(latitudes - coords[0]) <= dlat
+
+    # Longitude is only bounded when the spherical cap doesn't reach a pole.
+    if abs(lat0) + angle < math.pi / 2:
+        dlon = math.degrees(math.asin(math.sin(angle) / math.cos(lat0)))
+        # Skip longitude bounds across the antimeridian.
+        if -180 <= coords[1] - dlon and coords[1] + dlon <= 180:
+            mask &= np.abs(longitudes - coords[1]) <= dlon
+
+    return mask
+
+
+def nearest_index(
+    coords: tuple[float, float],
+    latitudes: NDArray[np.float64],
+    longitudes: NDArray[np.float64],
+    max_distance: float | None = None,
+) -> tuple[int, float] | None:
+    """Return index and distance (km) of the closest coordinates."""
+    indexes: NDArray[np.intp] | None = None
+    if max_distance is not None:
+        indexes = np.flatnonzero(
+            bounding_box_mask(coords, latitudes, longitudes, max_distance)
+        )
+        if indexes.size == 0:
+            return None
+        latitudes = latitudes[indexes]
+        longitudes = longitudes[indexes]
+
+    lat0 = np.radians(coords[0])
+    lon0 = np.radians(coords[1])
+    lats = np.radians(latitudes)
+    lons = np.radians(longitudes)
+
+    a = (
+        np.sin((lats - lat0) / 2) ** 2
+        + np.cos(lat0) * np.cos(lats) * np.sin((lons - lon0) / 2) ** 2
+    )
+
+    # arcsin(sqrt(a)) is monotonic, so the closest point minimizes a.
+    idx = int(np.argmin(a))
+    distance = 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a[idx]), 1.0))
+    if max_distance is not None and distance > max_distance:
+        return None
+    if indexes is not None:
+        idx = int(indexes[idx])
+    return idx, distance
+
+
+class CoordsCache:
+    """AEMET OpenData Coordinates Cache."""
+
+    items: list[dict[str, Any]]
+    latitudes: NDArray[np.float64]
+    longitudes: NDArray[np.float64]
+    tree: Any
+
+    def __init__(
+        self,
+        items: list[dict[str, Any]],
+        item_coords: Callable[[dict[str, Any]], tuple[float, float]],
+    ) -> None:
+        """Init AEMET OpenData Coordinates Cache."""
+        coords = [item_coords(item) for item in items]
+
+        self.items = items
+        self.latitudes = np.fromiter(
+            (cur[0] for cur in coords), dtype=np.float64, count=len(coords)
+        )
+        self.longitudes = np.fromiter(
+            (cur[1] for cur in coords), dtype=np.float64, count=len(coords)
+        )
+        if KDTree is not None and len(coords) > 0:
+            self.tree = KDTree(coords_to_xyz(self.latitudes, self.longitudes))
+        else:
+            self.tree = None
+
+    def __len__(self) -> int:
+        """Return number of cached items."""
+        return len(self.items)
+
+    def get_coords(self, idx: int) -> tuple[float, float]:
+        """Return cached item coordinates."""
+        return (float(self.latitudes[idx]), float(self.longitudes[idx]))
+
+    def nearest(
+        self, coords: tuple[float, float], max_distance: float | None = None
+    ) -> tuple[int, float] | None:
+        """Return index and distance (km) of the closest cached item."""
+        if len(self.items) == 0:
+            return None
+        if self.tree is not None:
+            point = coords_to_xyz(np.array([coords[0]]), np.array([coords[1]]))
+            if max_distance is not None:
+                max_chord = 2 * math.sin(
+                    min(max_distance / EARTH_RADIUS_KM, math.pi) / 2
+                )
+                chord, idx = self.tree.query(
+                    point[0], k=1, distance_upper_bound=max_chord
+                )
+            else:
+                chord, idx = self.tree.query(point[0], k=1)
+            if idx >= len(self.items):
+                return None
+            distance = 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+            return int(idx), distance
+        return nearest_index(coords, self.latitudes, self.longitudes, max_distance)
@@ -4,11 +4,61 @@ from datetime import datetime
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from .const import API_ID_PFX
-
+from .const import (
+    AEMET_ATTR_STATION_LATITUDE,
+    AEMET_ATTR_STATION_LONGITUDE,
+    AEMET_ATTR_TOWN_LATITUDE_DECIMAL,
+    AEMET_ATTR_TOWN_LONGITUDE_DECIMAL,
+    AEMET_ATTR_WEATHER_STATION_LATITUDE,
+    AEMET_ATTR_WEATHER_STATION_LONGITUDE,
+    API_ID_PFX,
+    ATTR_DATA,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
+)
+
+TZ_CANARY = ZoneInfo("Atlantic/Canary")
+TZ_MADRID = ZoneInfo("Europe/Madrid")
 TZ_UTC = ZoneInfo("UTC")
 
 
+def api_cache_key(cmd: str, fetch_data: bool) -> str:
+    """Return key of API conditional requests cache."""
+    return f"{cmd}?fetch_data={fetch_data}"
+
+
+def climatological_station_coords(station: dict[str, Any]) -> tuple[float, float]:
+    """Return climatological values station coordinates."""
+    return (
+        parse_station_coordinate(station[AEMET_ATTR_WEATHER_STATION_LATITUDE]),
+        parse_station_coordinate(station[AEMET_ATTR_WEATHER_STATION_LONGITUDE]),
+    )
+
+
+def conventional_station_coords(station: dict[str, Any]) -> tuple[float, float]:
+    """Return conventional observation station coordinates."""
+    return (
+        float(station[AEMET_ATTR_STATION_LATITUDE]),
+        float(station[AEMET_ATTR_STATION_LONGITUDE]),
+    )
+
+
+def copy_api_response(response: dict[str, Any]) -> dict[str, Any]:
+    """Return copy of API response, including its data list items."""
+    res = dict(response)
+    data = res.get(ATTR_DATA)
+    if isinstance(data, list):
+        res[ATTR_DATA] = [
+            dict(item) if isinstance(item, dict) else item for item in data
+        ]
+    return res
+
+
+def decimal_coords(data: dict[str, Any]) -> tuple[float, float]:
+    """Return parsed decimal coordinates."""
+    return (data[ATTR_LATITUDE], data[ATTR_LONGITUDE])
+
+
 def dict_nested_value(data: dict[str, Any] | None, keys: list[str] | None) -> Any:
     """Get value from dict with nested keys."""
     if keys is None or len(keys) == 0:
@@ -38,6 +88,18 @@ def parse_api_timestamp(timestamp: str, tz: ZoneInfo = TZ_UTC) -> datetime:
     return datetime.fromisoformat(timestamp).replace(tzinfo=tz)
 
 
+def parse_station_coordinate(coordinate: str) -> float:
+    """Parse climatological values station coordinate into decimal degrees."""
+    coord_deg = int(coordinate[0:2])
+    coord_min = int(coordinate[2:4])
+    coord_sec = int(coordinate[4:6])
+    coord_dir = coordinate[6:7]
+    value = coord_deg + coord_min / 60 + coord_sec / 3600
+    if coord_dir in ("S", "W"):
+        return -value
+    return value
+
+
 def parse_station_coordinates(latitude: str, longitude: str) -> str:
     """Parse climatological values station coordinates."""
     return f"{split_coordinate(latitude)} {split_coordinate(longitude)}"
@@ -50,8 +112,16 @@ def parse_town_code(town_id: str) -> str:
     return town_id
 
 
+def town_coords(town: dict[str, Any]) -> tuple[float, float]:
+    """Return town coordinates."""
+    return (
+        float(town[AEMET_ATTR_TOWN_LATITUDE_DECIMAL]),
+        float(town[AEMET_ATTR_TOWN_LONGITUDE_DECIMAL]),
+    )
+
+
 def timezone_from_coords(coords: tuple[float, float]) -> ZoneInfo:
     """Convert coordinates to timezone."""
     if coords[0] < 32 and coords[1] < -11.5:
-        return ZoneInfo("Atlantic/Canary")
-    return ZoneInfo("Europe/Madrid")
+        return TZ_CANARY
+    return TZ_MADRID
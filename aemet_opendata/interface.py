@@ -1,11 +1,14 @@
 """Client for the AEMET OpenData REST API."""
 
 import asyncio
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+import json
 import logging
+import os
 from typing import Any, cast
 
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientSession, ClientTimeout, hdrs
 from aiohttp.client_reqrep import ClientResponse
 import geopy.distance
 from geopy.distance import Distance
@@ -13,12 +16,6 @@ from geopy.distance import Distance
 from .const import (
     AEMET_ATTR_DATA,
     AEMET_ATTR_STATE,
-    AEMET_ATTR_STATION_LATITUDE,
-    AEMET_ATTR_STATION_LONGITUDE,
-    AEMET_ATTR_TOWN_LATITUDE_DECIMAL,
-    AEMET_ATTR_TOWN_LONGITUDE_DECIMAL,
-    AEMET_ATTR_WEATHER_STATION_LATITUDE,
-    AEMET_ATTR_WEATHER_STATION_LONGITUDE,
     AOD_CONDITION,
     AOD_DEW_POINT,
     AOD_FEEL_TEMP,
@@ -40,18 +37,32 @@ from .const import (
     AOD_WIND_DIRECTION,
     AOD_WIND_SPEED,
     AOD_WIND_SPEED_MAX,
+    API_CMD_CLIMATOLOGICAL_STATIONS,
+    API_CMD_CONVENTIONAL_STATIONS,
+    API_CMD_TOWNS,
+    API_MAX_REQUESTS,
     API_MIN_STATION_DISTANCE_KM,
     API_MIN_TOWN_DISTANCE_KM,
+    API_RETRIES,
+    API_RETRY_BACKOFF,
+    API_RETRY_STATUS,
     API_TIMEOUT,
     API_URL,
     ATTR_DATA,
     ATTR_DISTANCE,
+    ATTR_LATITUDE,
+    ATTR_LONGITUDE,
     ATTR_RESPONSE,
     RAW_FORECAST_DAILY,
     RAW_FORECAST_HOURLY,
     RAW_STATIONS,
     RAW_TOWNS,
+    STORAGE_CLIMATOLOGICAL_STATIONS,
+    STORAGE_CONVENTIONAL_STATIONS,
+    STORAGE_MAX_AGE,
+    STORAGE_TOWNS,
 )
+from .coords import CoordsCache, haversine_km
 from .exceptions import (
     AemetError,
     AemetTimeout,
@@ -61,10 +72,27 @@ from .exceptions import (
     TooManyRequests,
     TownNotFound,
 )
-from .helpers import get_current_datetime, parse_station_coordinates, parse_town_code
+from .helpers import (
+    api_cache_key,
+    climatological_station_coords,
+    conventional_station_coords,
+    copy_api_response,
+    decimal_coords,
+    get_current_datetime,
+    parse_town_code,
+    town_coords,
+)
 from .station import Station
+from .storage import load_storage, save_storage
 from .town import Town
 
+try:
+    import orjson
+
+    json_loads: Callable[[str], Any] = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -74,12 +102,21 @@ class ConnectionOptions:
 
     api_key: str
     station_data: bool = False
+    storage_dir: str | None = None
 
 
 class AEMET:
     """Interacts with the AEMET OpenData API."""
 
+    _api_conditional: dict[str, tuple[dict[str, str], dict[str, Any]]]
     _api_raw_data: dict[str, Any]
+    _api_stored: set[str]
+    _cache_locks: dict[str, asyncio.Lock]
+    _api_semaphore: asyncio.Semaphore
+    _api_timeout: ClientTimeout
+    _climatological_stations_cache: CoordsCache | None
+    _conventional_stations_cache: CoordsCache | None
+    _towns_cache: CoordsCache | None
     aiohttp_session: ClientSession
     coords: tuple[float, float] | None
     dist_hp: bool
@@ -94,12 +131,24 @@ class AEMET:
         options: ConnectionOptions,
     ) -> None:
         """Init AEMET OpenData API."""
+        self._api_conditional = {}
         self._api_raw_data = {
             RAW_FORECAST_DAILY: {},
             RAW_FORECAST_HOURLY: {},
             RAW_STATIONS: {},
             RAW_TOWNS: {},
         }
+        self._api_semaphore = asyncio.Semaphore(API_MAX_REQUESTS)
+        self._api_stored = set()
+        self._api_timeout = ClientTimeout(total=API_TIMEOUT)
+        self._cache_locks = {
+            STORAGE_CLIMATOLOGICAL_STATIONS: asyncio.Lock(),
+            STORAGE_CONVENTIONAL_STATIONS: asyncio.Lock(),
+            STORAGE_TOWNS: asyncio.Lock(),
+        }
+        self._climatological_stations_cache = None
+        self._conventional_stations_cache = None
+        self._towns_cache = None
         self.aiohttp_session = aiohttp_session
         self.coords = None
         self.dist_hp = False
@@ -111,35 +160,38 @@ class AEMET:
         self.station = None
         self.town = None
 
-    async def api_call(self, cmd: str, fetch_data: bool = False) -> dict[str, Any]:
-        """Perform Rest API call."""
+    async def api_call(
+        self, cmd: str, fetch_data: bool = False, conditional: bool = False
+    ) -> dict[str, Any]:
+        """Perform Rest API call.
+
+        Conditional responses are kept and returned as is on 304, so they are
+        shared between calls and must not be modified by the caller.
+        """
         _LOGGER.debug("api_call: cmd=%s", cmd)
 
-        try:
-            resp: ClientResponse = await self.aiohttp_session.request(
-                "GET",
-                f"{API_URL}/{cmd}",
-                timeout=API_TIMEOUT,
-                headers=self.headers,
-            )
-        except asyncio.TimeoutError as err:
-            raise AemetTimeout(err) from err
-        except ClientError as err:
-            raise AemetError(err) from err
+        headers = self.headers
+        cache_key = api_cache_key(cmd, fetch_data)
+        cached = self._api_conditional.get(cache_key) if conditional else None
+        if cached is not None:
+            headers = {**self.headers, **cached[0]}
+
+        status, resp_headers, resp_json = await self.api_request(
+            f"{API_URL}/{cmd}", headers
+        )
 
-        if resp.status == 401:
+        if status == 304 and cached is not None:
+            _LOGGER.debug("api_call: cmd=%s not modified", cmd)
+            return cached[1]
+        if status == 401:
             raise AuthError("API authentication error")
-        if resp.status == 404:
+        if status == 404:
             raise ApiError("API data error")
-        if resp.status == 429:
+        if status == 429:
             raise TooManyRequests("Too many API requests")
-        if resp.status != 200:
-            raise AemetError(f"API status={resp.status}")
+        if status != 200:
+            raise AemetError(f"API status={status}")
 
-        try:
-            resp_json = await resp.json(content_type=None)
-        except asyncio.TimeoutError as err:
-            raise AemetTimeout(err) from err
         _LOGGER.debug("api_call: cmd=%s resp=%s", cmd, resp_json)
 
         if isinstance(resp_json, dict):
@@ -159,34 +211,32 @@ class AEMET:
                 ATTR_DATA: json_response,
             }
 
+        if conditional:
+            validators: dict[str, str] = {}
+            if hdrs.ETAG in resp_headers:
+                validators[hdrs.IF_NONE_MATCH] = resp_headers[hdrs.ETAG]
+            if hdrs.LAST_MODIFIED in resp_headers:
+                validators[hdrs.IF_MODIFIED_SINCE] = resp_headers[hdrs.LAST_MODIFIED]
+            if validators:
+                self._api_conditional[cache_key] = (validators, json_response)
+            else:
+                self._api_conditional.pop(cache_key, None)
+
         return json_response
 
     async def api_data(self, url: str) -> dict[str, Any]:
         """Fetch API data."""
         _LOGGER.debug("api_data: url=%s", url)
 
-        try:
-            resp: ClientResponse = await self.aiohttp_session.request(
-                "GET",
-                url,
-                timeout=API_TIMEOUT,
-            )
-        except asyncio.TimeoutError as err:
-            raise AemetTimeout(err) from err
-        except ClientError as err:
-            raise AemetError(err) from err
+        status, _, resp_json = await self.api_request(url)
 
-        if resp.status == 404:
+        if status == 404:
             raise ApiError("API data error")
-        if resp.status == 429:
+        if status == 429:
             raise TooManyRequests("Too many API requests")
-        if resp.status != 200:
-            raise AemetError(f"API status={resp.status}")
+        if status != 200:
+            raise AemetError(f"API status={status}")
 
-        try:
-            resp_json = await resp.json(content_type=None)
-        except asyncio.TimeoutError as err:
-            raise AemetTimeout(err) from err
         _LOGGER.debug("api_data: url=%s resp=%s", url, resp_json)
 
         if isinstance(resp_json, dict):
@@ -195,6 +245,38 @@ class AEMET:
 
         return cast(dict[str, Any], resp_json)
 
+    async def api_request(
+        self, url: str, headers: dict[str, Any] | None = None
+    ) -> tuple[int, Mapping[str, str], Any]:
+        """Perform API request, retrying on transient server errors."""
+        retry = 0
+        while True:
+            try:
+                # Hold the semaphore until the body has been read.
+                async with self._api_semaphore:
+                    resp: ClientResponse = await self.aiohttp_session.request(
+                        "GET",
+                        url,
+                        timeout=self._api_timeout,
+                        headers=headers,
+                    )
+                    resp_json: Any = None
+                    if resp.status == 200:
+                        resp_json = await resp.json(content_type=None, loads=json_loads)
+                    else:
+                        resp.release()
+            except asyncio.TimeoutError as err:
+                raise AemetTimeout(err) from err
+            except ClientError as err:
+                raise AemetError(err) from err
+
+            if resp.status not in API_RETRY_STATUS or retry >= API_RETRIES:
+                return resp.status, resp.headers, resp_json
+
+            _LOGGER.debug("api_request: url=%s status=%s retry", url, resp.status)
+            await asyncio.sleep(API_RETRY_BACKOFF * (2**retry))
+            retry += 1
+
     def raw_data(self) -> dict[str, Any]:
         """Return raw AEMET OpenData API data."""
         return self._api_raw_data
@@ -225,6 +307,29 @@ class AEMET:
             return geopy.distance.geodesic(start, end)
         return geopy.distance.great_circle(start, end)
 
+    def calc_distance_km(
+        self, start: tuple[float, float], end: tuple[float, float]
+    ) -> float:
+        """Calculate distance (km) between 2 points."""
+        if self.dist_hp:
+            return float(geopy.distance.geodesic(start, end).km)
+        return haversine_km(start, end)
+
+    def calc_nearest(
+        self,
+        coords: tuple[float, float],
+        cache: CoordsCache,
+        max_distance: float | None = None,
+    ) -> tuple[int, float] | None:
+        """Calculate index and distance (km) of the closest cached coordinates."""
+        nearest = cache.nearest(coords, max_distance)
+        if nearest is None:
+            return None
+        # Only the winner distance is reported, so compute it the same way
+        # regardless of the search backend (KD-tree or NumPy scan).
+        idx = nearest[0]
+        return idx, self.calc_distance_km(coords, cache.get_coords(idx))
+
     def distance_high_precision(self, dist_hp: bool) -> bool:
         """Enable/Disable high precision for distance calculations."""
         self.dist_hp = dist_hp
@@ -234,34 +339,50 @@ class AEMET:
         self, fetch_data: bool = True
     ) -> dict[str, Any]:
         """Get stations available for climatological values."""
-        return await self.api_call(
-            "valores/climatologicos/inventarioestaciones/todasestaciones", fetch_data
+        res = await self.api_call(
+            API_CMD_CLIMATOLOGICAL_STATIONS, fetch_data, conditional=True
         )
+        return copy_api_response(res)
 
     async def get_climatological_values_station_by_coordinates(
         self, latitude: float, longitude: float
     ) -> dict[str, Any]:
         """Get closest climatological values station to coordinates."""
         station: dict[str, Any] | None = None
-        stations = await self.get_climatological_values_stations()
+        cache = await self.get_climatological_values_stations_cache()
         search_coords = (latitude, longitude)
-        distance = API_MIN_STATION_DISTANCE_KM
-        for cur_station in stations[ATTR_DATA]:
-            station_coords = parse_station_coordinates(
-                cur_station[AEMET_ATTR_WEATHER_STATION_LATITUDE],
-                cur_station[AEMET_ATTR_WEATHER_STATION_LONGITUDE],
-            )
-            station_point = geopy.point.Point(station_coords)
-            cur_coords = (station_point.latitude, station_point.longitude)
-            cur_distance = self.calc_distance(search_coords, cur_coords).km
-            if cur_distance < distance:
-                distance = cur_distance
-                station = cur_station
+        distance: float = API_MIN_STATION_DISTANCE_KM
+        nearest = self.calc_nearest(search_coords, cache, distance)
+        if nearest is not None and nearest[1] < distance:
+            distance = nearest[1]
+            station = dict(cache.items[nearest[0]])
         if station is None:
             raise StationNotFound(f"No stations found for [{latitude}, {longitude}]")
         _LOGGER.debug("distance: %s, station: %s", distance, station)
         return station
 
+    async def get_climatological_values_stations_cache(self) -> CoordsCache:
+        """Get cached coordinates of climatological values stations."""
+        async with self._cache_locks[STORAGE_CLIMATOLOGICAL_STATIONS]:
+            if self._climatological_stations_cache is None:
+                stations = await self.get_stored_data(
+                    STORAGE_CLIMATOLOGICAL_STATIONS, API_CMD_CLIMATOLOGICAL_STATIONS
+                )
+                station_list: list[dict[str, Any]] = []
+                for cur_station in stations[ATTR_DATA]:
+                    cur_coords = climatological_station_coords(cur_station)
+                    station_list += [
+                        {
+                            **cur_station,
+                            ATTR_LATITUDE: cur_coords[0],
+                            ATTR_LONGITUDE: cur_coords[1],
+                        }
+                    ]
+                self._climatological_stations_cache = CoordsCache(
+                    station_list, decimal_coords
+                )
+            return self._climatological_stations_cache
+
     async def get_climatological_values_station_data(
         self, station: str, fetch_data: bool = True
     ) -> dict[str, Any]:
@@ -275,31 +396,41 @@ class AEMET:
         self, fetch_data: bool = True
     ) -> dict[str, Any]:
         """Get stations available for conventional observations."""
-        return await self.api_call("observacion/convencional/todas", fetch_data)
+        res = await self.api_call(
+            API_CMD_CONVENTIONAL_STATIONS, fetch_data, conditional=True
+        )
+        return copy_api_response(res)
 
     async def get_conventional_observation_station_by_coordinates(
         self, latitude: float, longitude: float
     ) -> dict[str, Any]:
         """Get closest conventional observation station to coordinates."""
         station: dict[str, Any] | None = None
-        stations = await self.get_conventional_observation_stations()
+        cache = await self.get_conventional_observation_stations_cache()
         search_coords = (latitude, longitude)
-        distance = API_MIN_STATION_DISTANCE_KM
-        for cur_station in stations[ATTR_DATA]:
-            cur_coords = (
-                cur_station[AEMET_ATTR_STATION_LATITUDE],
-                cur_station[AEMET_ATTR_STATION_LONGITUDE],
-            )
-            cur_distance = self.calc_distance(search_coords, cur_coords).km
-            if cur_distance < distance:
-                distance = cur_distance
-                station = cur_station
+        distance: float = API_MIN_STATION_DISTANCE_KM
+        nearest = self.calc_nearest(search_coords, cache, distance)
+        if nearest is not None and nearest[1] < distance:
+            distance = nearest[1]
+            station = dict(cache.items[nearest[0]])
         if station is None:
             raise StationNotFound(f"No stations found for [{latitude}, {longitude}]")
         _LOGGER.debug("distance: %s, station: %s", distance, station)
         station[ATTR_DISTANCE] = distance
         return station
 
+    async def get_conventional_observation_stations_cache(self) -> CoordsCache:
+        """Get cached coordinates of conventional observation stations."""
+        async with self._cache_locks[STORAGE_CONVENTIONAL_STATIONS]:
+            if self._conventional_stations_cache is None:
+                stations = await self.get_stored_data(
+                    STORAGE_CONVENTIONAL_STATIONS, API_CMD_CONVENTIONAL_STATIONS
+                )
+                self._conventional_stations_cache = CoordsCache(
+                    stations[ATTR_DATA], conventional_station_coords
+                )
+            return self._conventional_stations_cache
+
     async def get_conventional_observation_station_data(
         self, station: str, fetch_data: bool = True
     ) -> dict[str, Any]:
@@ -336,6 +467,34 @@ class AEMET:
         self._api_raw_data[RAW_FORECAST_HOURLY][town] = res
         return res
 
+    async def get_stored_data(self, name: str, cmd: str) -> dict[str, Any]:
+        """Get API data from storage, fetching and storing it if needed."""
+        if self.options.storage_dir is None:
+            return await self.api_call(cmd, True, conditional=True)
+
+        cache_key = api_cache_key(cmd, True)
+        loop = asyncio.get_running_loop()
+        path = os.path.join(self.options.storage_dir, f"{name}.json")
+
+        if name not in self._api_stored:
+            self._api_stored.add(name)
+            stored = await loop.run_in_executor(
+                None, load_storage, path, STORAGE_MAX_AGE
+            )
+            if stored is not None:
+                _LOGGER.debug("get_stored_data: name=%s loaded", name)
+                data, validators = stored
+                if validators:
+                    self._api_conditional[cache_key] = (validators, data)
+                return data
+
+        data = await self.api_call(cmd, True, conditional=True)
+        if isinstance(data.get(ATTR_DATA), list):
+            cached = self._api_conditional.get(cache_key)
+            validators = cached[0] if cached is not None else {}
+            await loop.run_in_executor(None, save_storage, path, data, validators)
+        return data
+
     async def get_town(self, town: str) -> dict[str, Any]:
         """Get information about specific town."""
         res = await self.api_call(f"maestro/municipio/{town}")
@@ -347,55 +506,70 @@ class AEMET:
     ) -> dict[str, Any]:
         """Get closest town to coordinates."""
         town: dict[str, Any] | None = None
-        towns = await self.get_towns()
+        cache = await self.get_towns_cache()
         search_coords = (latitude, longitude)
-        distance = API_MIN_TOWN_DISTANCE_KM
-        for cur_town in towns[ATTR_DATA]:
-            cur_coords = (
-                cur_town[AEMET_ATTR_TOWN_LATITUDE_DECIMAL],
-                cur_town[AEMET_ATTR_TOWN_LONGITUDE_DECIMAL],
-            )
-            cur_distance = self.calc_distance(search_coords, cur_coords).km
-            if cur_distance < distance:
-                distance = cur_distance
-                town = cur_town
+        distance: float = API_MIN_TOWN_DISTANCE_KM
+        nearest = self.calc_nearest(search_coords, cache, distance)
+        if nearest is not None and nearest[1] < distance:
+            distance = nearest[1]
+            town = dict(cache.items[nearest[0]])
         if town is None:
             raise TownNotFound(f"No towns found for [{latitude}, {longitude}]")
         _LOGGER.debug("distance: %s, town: %s", distance, town)
         town[ATTR_DISTANCE] = distance
         return town
 
-    async def get_towns(
-        self, fetch_data: bool = True
-    ) -> dict[str, Any]:
+    async def get_towns(self, fetch_data: bool = True) -> dict[str, Any]:
         """Get information about towns."""
-        return await self.api_call("maestro/municipios", fetch_data)
+        res = await self.api_call(API_CMD_TOWNS, fetch_data, conditional=True)
+        return copy_api_response(res)
+
+    async def get_towns_cache(self) -> CoordsCache:
+        """Get cached coordinates of towns."""
+        async with self._cache_locks[STORAGE_TOWNS]:
+            if self._towns_cache is None:
+                towns = await self.get_stored_data(STORAGE_TOWNS, API_CMD_TOWNS)
+                self._towns_cache = CoordsCache(towns[ATTR_DATA], town_coords)
+            return self._towns_cache
+
+    def invalidate_stations_cache(self) -> None:
+        """Invalidate cached stations coordinates."""
+        self._climatological_stations_cache = None
+        self._conventional_stations_cache = None
+
+    def invalidate_towns_cache(self) -> None:
+        """Invalidate cached towns coordinates."""
+        self._towns_cache = None
 
     async def select_coordinates(self, latitude: float, longitude: float) -> None:
         """Select town and station based on provided coordinates."""
         coords = (latitude, longitude)
 
-        if self.options.station_data:
-            try:
-                station_data = (
-                    await self.get_conventional_observation_station_by_coordinates(
-                        latitude,
-                        longitude,
-                    )
-                )
-            except StationNotFound as err:
-                _LOGGER.error(err)
-                station_data = None
-        else:
-            station_data = None
-
-        town_data = await self.get_town_by_coordinates(latitude, longitude)
+        town_data, station_data = await asyncio.gather(
+            self.get_town_by_coordinates(latitude, longitude),
+            self.select_station_data(latitude, longitude),
+        )
 
         self.coords = coords
         if station_data is not None:
             self.station = Station(station_data)
         self.town = Town(town_data)
 
+    async def select_station_data(
+        self, latitude: float, longitude: float
+    ) -> dict[str, Any] | None:
+        """Select station data based on provided coordinates."""
+        if not self.options.station_data:
+            return None
+        try:
+            return await self.get_conventional_observation_station_by_coordinates(
+                latitude,
+                longitude,
+            )
+        except StationNotFound as err:
+            _LOGGER.error(err)
+            return None
+
     async def update_daily(self) -> None:
         """Update AEMET OpenData town daily forecast."""
         if self.town is not None:
@@ -1,7 +1,8 @@
 """AEMET OpenData Station."""
 
 from datetime import datetime
-from typing import Any
+from operator import itemgetter
+from typing import Any, ClassVar
 from zoneinfo import ZoneInfo
 
 from .const import (
@@ -51,22 +52,76 @@ from .helpers import get_current_datetime, parse_api_timestamp, timezone_from_co
 class Station:
     """AEMET OpenData Station."""
 
+    __slots__ = (
+        "_datetime",
+        "altitude",
+        "coords",
+        "dew_point",
+        "distance",
+        "humidity",
+        "id",
+        "name",
+        "precipitation",
+        "pressure",
+        "temp",
+        "temp_max",
+        "temp_min",
+        "wind_direction",
+        "wind_speed",
+        "wind_speed_max",
+        "zoneinfo",
+    )
+
+    _DATA_OPTIONAL: ClassVar[tuple[tuple[str, str], ...]] = (
+        (AOD_DEW_POINT, "dew_point"),
+        (AOD_HUMIDITY, "humidity"),
+        (AOD_PRECIPITATION, "precipitation"),
+        (AOD_PRESSURE, "pressure"),
+        (AOD_TEMP, "temp"),
+        (AOD_TEMP_MAX, "temp_max"),
+        (AOD_TEMP_MIN, "temp_min"),
+        (AOD_WIND_DIRECTION, "wind_direction"),
+        (AOD_WIND_SPEED, "wind_speed"),
+        (AOD_WIND_SPEED_MAX, "wind_speed_max"),
+    )
+    _SAMPLE_FLOAT: ClassVar[tuple[tuple[str, str], ...]] = (
+        (AEMET_ATTR_STATION_DEWPOINT, "dew_point"),
+        (AEMET_ATTR_STATION_HUMIDITY, "humidity"),
+        (AEMET_ATTR_STATION_PRECIPITATION, "precipitation"),
+        (AEMET_ATTR_STATION_TEMPERATURE, "temp"),
+        (AEMET_ATTR_STATION_TEMPERATURE_MAX, "temp_max"),
+        (AEMET_ATTR_STATION_TEMPERATURE_MIN, "temp_min"),
+        (AEMET_ATTR_STATION_WIND_DIRECTION, "wind_direction"),
+        (AEMET_ATTR_STATION_WIND_SPEED, "wind_speed"),
+        (AEMET_ATTR_STATION_WIND_SPEED_MAX, "wind_speed_max"),
+    )
+    _WEATHER_OPTIONAL: ClassVar[tuple[tuple[str, str], ...]] = (
+        (AOD_DEW_POINT, "dew_point"),
+        (AOD_HUMIDITY, "humidity"),
+        (AOD_PRECIPITATION, "precipitation"),
+        (AOD_PRESSURE, "pressure"),
+        (AOD_TEMP, "temp"),
+        (AOD_WIND_DIRECTION, "wind_direction"),
+        (AOD_WIND_SPEED, "wind_speed"),
+        (AOD_WIND_SPEED_MAX, "wind_speed_max"),
+    )
+
     altitude: float
     coords: tuple[float, float]
     _datetime: datetime
     distance: float
-    dew_point: float | None = None
-    humidity: float | None = None
+    dew_point: float | None
+    humidity: float | None
     id: str
     name: str
-    precipitation: float | None = None
-    pressure: float | None = None
-    temp: float | None = None
-    temp_max: float | None = None
-    temp_min: float | None = None
-    wind_direction: float | None = None
-    wind_speed: float | None = None
-    wind_speed_max: float | None = None
+    precipitation: float | None
+    pressure: float | None
+    temp: float | None
+    temp_max: float | None
+    temp_min: float | None
+    wind_direction: float | None
+    wind_speed: float | None
+    wind_speed_max: float | None
     zoneinfo: ZoneInfo
 
     def __init__(self, data: dict[str, Any]) -> None:
@@ -77,9 +132,19 @@ class Station:
             float(data[AEMET_ATTR_STATION_LATITUDE]),
             float(data[AEMET_ATTR_STATION_LONGITUDE]),
         )
+        self.dew_point = None
         self.distance = float(data[ATTR_DISTANCE])
+        self.humidity = None
         self.id = str(data[AEMET_ATTR_IDEMA])
         self.name = str(data[AEMET_ATTR_STATION_LOCATION])
+        self.precipitation = None
+        self.pressure = None
+        self.temp = None
+        self.temp_max = None
+        self.temp_min = None
+        self.wind_direction = None
+        self.wind_speed = None
+        self.wind_speed_max = None
         self.zoneinfo = timezone_from_coords(self.coords)
 
         self.update_sample(data)
@@ -167,106 +232,43 @@ class Station:
 
         self._datetime = station_dt.astimezone(self.get_timezone())
 
-        if AEMET_ATTR_STATION_DEWPOINT in data:
-            self.dew_point = float(data[AEMET_ATTR_STATION_DEWPOINT])
-
-        if AEMET_ATTR_STATION_HUMIDITY in data:
-            self.humidity = float(data[AEMET_ATTR_STATION_HUMIDITY])
-
-        if AEMET_ATTR_STATION_PRECIPITATION in data:
-            self.precipitation = float(data[AEMET_ATTR_STATION_PRECIPITATION])
+        for key, attr in self._SAMPLE_FLOAT:
+            if key in data:
+                setattr(self, attr, float(data[key]))
 
         if AEMET_ATTR_STATION_PRESSURE_SEA in data:
             self.pressure = float(data[AEMET_ATTR_STATION_PRESSURE_SEA])
         elif AEMET_ATTR_STATION_PRESSURE in data:
             self.pressure = float(data[AEMET_ATTR_STATION_PRESSURE])
 
-        if AEMET_ATTR_STATION_TEMPERATURE in data:
-            self.temp = float(data[AEMET_ATTR_STATION_TEMPERATURE])
-
-        if AEMET_ATTR_STATION_TEMPERATURE_MAX in data:
-            self.temp_max = float(data[AEMET_ATTR_STATION_TEMPERATURE_MAX])
-
-        if AEMET_ATTR_STATION_TEMPERATURE_MIN in data:
-            self.temp_min = float(data[AEMET_ATTR_STATION_TEMPERATURE_MIN])
-
-        if AEMET_ATTR_STATION_WIND_DIRECTION in data:
-            self.wind_direction = float(data[AEMET_ATTR_STATION_WIND_DIRECTION])
-
-        if AEMET_ATTR_STATION_WIND_SPEED in data:
-            self.wind_speed = float(data[AEMET_ATTR_STATION_WIND_SPEED])
-
-        if AEMET_ATTR_STATION_WIND_SPEED_MAX in data:
-            self.wind_speed_max = float(data[AEMET_ATTR_STATION_WIND_SPEED_MAX])
-
     def update_samples(self, samples: dict[str, Any]) -> None:
         """Update Station data from samples."""
-        latest: dict[str, Any]
-        latest_dt: datetime | None = None
-        for sample in samples[ATTR_DATA]:
-            dt = parse_api_timestamp(sample[AEMET_ATTR_STATION_DATE])
-            if latest_dt is None or dt > latest_dt:
-                latest = sample
-                latest_dt = dt
-        if (
-            latest_dt is not None
-            and self.get_datetime() < latest_dt <= get_current_datetime()
-        ):
+        if len(samples[ATTR_DATA]) == 0:
+            return
+        # AEMET timestamps are ISO 8601, so they sort lexicographically.
+        latest = max(samples[ATTR_DATA], key=itemgetter(AEMET_ATTR_STATION_DATE))
+        latest_dt = parse_api_timestamp(latest[AEMET_ATTR_STATION_DATE])
+        if self.get_datetime() < latest_dt <= get_current_datetime():
             self.update_sample(latest)
 
     def data(self) -> dict[str, Any]:
         """Return station data."""
         data: dict[str, Any] = {
-            AOD_ALTITUDE: self.get_altitude(),
-            AOD_COORDS: self.get_coords(),
-            AOD_DATETIME: self.get_datetime(),
+            AOD_ALTITUDE: self.altitude,
+            AOD_COORDS: self.coords,
+            AOD_DATETIME: self._datetime,
             AOD_DISTANCE: self.get_distance(),
-            AOD_ID: self.get_id(),
-            AOD_NAME: self.get_name(),
+            AOD_ID: self.id,
+            AOD_NAME: self.name,
             AOD_OUTDATED: self.get_outdated(),
             AOD_TIMESTAMP_UTC: self.get_timestamp_utc(),
-            AOD_TIMEZONE: self.get_timezone(),
+            AOD_TIMEZONE: self.zoneinfo,
         }
 
-        dew_point = self.get_dew_point()
-        if dew_point is not None:
-            data[AOD_DEW_POINT] = dew_point
-
-        humidity = self.get_humidity()
-        if humidity is not None:
-            data[AOD_HUMIDITY] = humidity
-
-        precipitation = self.get_precipitation()
-        if precipitation is not None:
-            data[AOD_PRECIPITATION] = precipitation
-
-        pressure = self.get_pressure()
-        if pressure is not None:
-            data[AOD_PRESSURE] = pressure
-
-        temp = self.get_temp()
-        if temp is not None:
-            data[AOD_TEMP] = temp
-
-        temp_max = self.get_temp_max()
-        if temp_max is not None:
-            data[AOD_TEMP_MAX] = temp_max
-
-        temp_min = self.get_temp_min()
-        if temp_min is not None:
-            data[AOD_TEMP_MIN] = temp_min
-
-        wind_direction = self.get_wind_direction()
-        if wind_direction is not None:
-            data[AOD_WIND_DIRECTION] = wind_direction
-
-        wind_speed = self.get_wind_speed()
-        if wind_speed is not None:
-            data[AOD_WIND_SPEED] = wind_speed
-
-        wind_speed_max = self.get_wind_speed_max()
-        if wind_speed_max is not None:
-            data[AOD_WIND_SPEED_MAX] = wind_speed_max
+        for key, attr in self._DATA_OPTIONAL:
+            value = getattr(self, attr)
+            if value is not None:
+                data[key] = value
 
         return data
 
@@ -274,36 +276,9 @@ class Station:
         """Return Station weather data."""
         weather: dict[str, Any] = {}
 
-        dew_point = self.get_dew_point()
-        if dew_point is not None:
-            weather[AOD_DEW_POINT] = dew_point
-
-        humidity = self.get_humidity()
-        if humidity is not None:
-            weather[AOD_HUMIDITY] = humidity
-
-        precipitation = self.get_precipitation()
-        if precipitation is not None:
-            weather[AOD_PRECIPITATION] = precipitation
-
-        pressure = self.get_pressure()
-        if pressure is not None:
-            weather[AOD_PRESSURE] = pressure
-
-        temp = self.get_temp()
-        if temp is not None:
-            weather[AOD_TEMP] = temp
-
-        wind_direction = self.get_wind_direction()
-        if wind_direction is not None:
-            weather[AOD_WIND_DIRECTION] = wind_direction
-
-        wind_speed = self.get_wind_speed()
-        if wind_speed is not None:
-            weather[AOD_WIND_SPEED] = wind_speed
-
-        wind_speed_max = self.get_wind_speed_max()
-        if wind_speed_max is not None:
-            weather[AOD_WIND_SPEED_MAX] = wind_speed_max
+        for key, attr in self._WEATHER_OPTIONAL:
+            value = getattr(self, attr)
+            if value is not None:
+                weather[key] = value
 
         return weather
@@ -0,0 +1,73 @@
+"""AEMET OpenData Storage."""
+
+import contextlib
+from datetime import datetime, timedelta
+import json
+import logging
+import os
+import tempfile
+from typing import Any, cast
+
+from .const import ATTR_DATA, STORAGE_DATA, STORAGE_TIMESTAMP, STORAGE_VALIDATORS
+from .helpers import get_current_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def load_storage(
+    path: str, max_age: timedelta
+) -> tuple[dict[str, Any], dict[str, str]] | None:
+    """Load stored API data and validators if they aren't older than max age."""
+    try:
+        with open(path, encoding="utf-8") as file:
+            stored = json.load(file)
+        timestamp = datetime.fromisoformat(stored[STORAGE_TIMESTAMP])
+        if timestamp.tzinfo is None:
+            raise ValueError(f"timestamp without timezone: {timestamp}")
+        age = get_current_datetime() - timestamp
+        data = cast(dict[str, Any], stored[STORAGE_DATA])
+        if not isinstance(data[ATTR_DATA], list):
+            raise ValueError(f"invalid stored data: {data[ATTR_DATA]}")
+        validators = {
+            str(key): str(value)
+            for key, value in stored.get(STORAGE_VALIDATORS, {}).items()
+        }
+    except (AttributeError, KeyError, OSError, TypeError, ValueError) as err:
+        _LOGGER.debug("load_storage: path=%s err=%s", path, err)
+        return None
+
+    if age < timedelta() or age > max_age:
+        _LOGGER.debug("load_storage: path=%s age=%s invalid", path, age)
+        return None
+
+    return data, validators
+
+
+def save_storage(path: str, data: dict[str, Any], validators: dict[str, str]) -> None:
+    """Save API data and validators to storage."""
+    stored = {
+        STORAGE_DATA: data,
+        STORAGE_TIMESTAMP: get_current_datetime().isoformat(),
+        STORAGE_VALIDATORS: validators,
+    }
+
+    tmp_path: str | None = None
+    try:
+        storage_dir = os.path.dirname(path)
+        os.makedirs(storage_dir, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=storage_dir,
+            prefix=f"{os.path.basename(path)}.",
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            tmp_path = file.name
+            json.dump(stored, file)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as err:
+        _LOGGER.warning("save_storage: path=%s err=%s", path, err)
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)